@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-15 01:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_post_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='commentlike',
+            index=models.Index(fields=['-created_at', 'comment'], name='commentlike_created_cmt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postlike',
+            index=models.Index(fields=['-created_at', 'post'], name='postlike_created_post_idx'),
+        ),
+    ]
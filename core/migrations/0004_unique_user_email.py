@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0003_like_created_at_idx'),
+    ]
+
+    operations = [
+        # auth.User.email isn't unique; enforce it here so registration can rely on the constraint.
+        # Blank emails stay allowed since email is optional on signup.
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX core_unique_user_email ON auth_user (email) WHERE email <> ''",
+            reverse_sql="DROP INDEX core_unique_user_email",
+        ),
+    ]
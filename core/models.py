@@ -7,6 +7,11 @@ class Post(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='post_created_id_idx')
+        ]
+
     def __str__(self):
         return f'Post {self.id} by {self.author}'
 
@@ -31,6 +36,9 @@ class PostLike(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['user', 'post'], name='unique_user_post_like')
         ]
+        indexes = [
+            models.Index(fields=['-created_at', 'post'], name='postlike_created_post_idx')
+        ]
 
     def __str__(self):
         return f'PostLike {self.id}'
@@ -45,6 +53,9 @@ class CommentLike(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['user', 'comment'], name='unique_user_comment_like')
         ]
+        indexes = [
+            models.Index(fields=['-created_at', 'comment'], name='commentlike_created_cmt_idx')
+        ]
 
     def __str__(self):
         return f'CommentLike {self.id}'
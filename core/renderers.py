@@ -0,0 +1,17 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson. Datetimes are encoded natively; anything orjson
+    doesn't know (lazy strings, Decimal, ...) falls back to DRF's JSONEncoder."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # OPT_UTC_Z keeps the 'Z' suffix DRF's DateTimeField produces, so all endpoints agree;
+        # OPT_NON_STR_KEYS stringifies int keys like json.dumps (DRF list errors are {0: [...]})
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self.encoder_class().default, option=option)
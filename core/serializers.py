@@ -1,15 +1,25 @@
+from copy import copy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from .models import Post, Comment, CommentLike
+from django.db import IntegrityError
 from django.db.models import Count
 
 User = get_user_model()
 
 
-class UserMinimalSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = User
-        fields = ('id', 'username')
+class CachedFieldsSerializerMixin:
+    """Build the declared/model fields once per serializer class and hand out shallow copies"""
+    _field_cache = {}
+
+    def get_fields(self):
+        cached = self._field_cache.get(type(self))
+        if cached is None:
+            cached = super().get_fields()
+            self._field_cache[type(self)] = cached
+        return {name: copy(field) for name, field in cached.items()}
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -20,34 +30,36 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'date_joined')
 
 
-class CommentSerializer(serializers.ModelSerializer):
-    author = UserMinimalSerializer(read_only=True)
-    children = serializers.SerializerMethodField()
-    like_count = serializers.SerializerMethodField()
+class CommentSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    author = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
         model = Comment
-        fields = ('id', 'author', 'content', 'created_at', 'parent', 'children', 'post', 'like_count')
-    
-    def get_like_count(self, obj):
-        return obj.likes.count()
-    
-    def get_children(self, obj):
-        # Return empty list for children - they're handled by the tree building in views
-        return []
-
-
-class PostSerializer(serializers.ModelSerializer):
-    author = UserMinimalSerializer(read_only=True)
+        fields = ('id', 'author', 'content', 'created_at', 'parent', 'post', 'like_count')
+
+    def get_author(self, obj):
+        return {'id': obj.author_id, 'username': obj.author.username}
+
+
+class PostSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    author = serializers.SerializerMethodField()
     like_count = serializers.IntegerField(read_only=True)
-    comment_count = serializers.SerializerMethodField()
+    comment_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
         model = Post
         fields = ('id', 'author', 'content', 'created_at', 'like_count', 'comment_count')
-    
-    def get_comment_count(self, obj):
-        return obj.comments.count()
+
+    def get_author(self, obj):
+        return {'id': obj.author_id, 'username': obj.author.username}
+
+
+# field -> (postgres constraint name, sqlite "table.column") for the unique checks registration relies on
+UNIQUE_USER_CONSTRAINTS = {
+    'username': ('auth_user_username_key', 'auth_user.username'),
+    'email': ('core_unique_user_email', 'auth_user.email'),
+}
 
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -56,21 +68,27 @@ class RegisterSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'username', 'email', 'password')
-
-    def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("Username already exists")
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("Email already exists")
-        return value
+        # uniqueness is left to the database constraints, see create()
+        extra_kwargs = {'username': {'validators': [UnicodeUsernameValidator()]}}
 
     def create(self, validated_data):
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data.get('email', ''),
-            password=validated_data['password']
-        )
+        try:
+            user = User.objects.create_user(
+                username=validated_data['username'],
+                email=validated_data.get('email', ''),
+                password=validated_data['password']
+            )
+        except IntegrityError as exc:
+            # postgres exposes the violated constraint name; sqlite only reports
+            # "UNIQUE constraint failed: table.column" in the message
+            constraint = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+            message = str(exc)
+            for field, names in UNIQUE_USER_CONSTRAINTS.items():
+                if constraint is not None:
+                    matched = constraint in names
+                else:
+                    matched = any(message == f'UNIQUE constraint failed: {name}' for name in names)
+                if matched:
+                    raise serializers.ValidationError({field: [f"{field.capitalize()} already exists"]})
+            raise
         return user
\ No newline at end of file
@@ -1,9 +1,13 @@
-from django.db import transaction, IntegrityError, connection, models
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model, authenticate
@@ -23,14 +27,15 @@ class RegisterAPIView(APIView):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
-            return Response({
-                'user': UserSerializer(user).data,
-                'tokens': {
+            data = {'user': UserSerializer(user).data}
+            # clients that log in right after signing up can pass ?issue_tokens=0 to skip signing here
+            if request.query_params.get('issue_tokens') != '0':
+                refresh = RefreshToken.for_user(user)
+                data['tokens'] = {
                     'refresh': str(refresh),
                     'access': str(refresh.access_token),
                 }
-            }, status=status.HTTP_201_CREATED)
+            return Response(data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -68,10 +73,18 @@ class CurrentUserAPIView(APIView):
         return Response(serializer.data)
 
 
+class PostCursorPagination(CursorPagination):
+    """Keyset pagination for the feed so deep pages don't pay for an OFFSET scan"""
+    # id breaks created_at ties deterministically; matches the post_created_id_idx index
+    ordering = ('-created_at', '-id')
+    page_size = 20
+
+
 class PostListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Post.objects.all().select_related('author').prefetch_related('likes', 'comments')
+    queryset = Post.objects.all().select_related('author')
     serializer_class = PostSerializer
     permission_classes = (AllowAny,)
+    pagination_class = PostCursorPagination
 
     def perform_create(self, serializer):
         if not self.request.user.is_authenticated:
@@ -82,43 +95,91 @@ class PostListCreateAPIView(generics.ListCreateAPIView):
         serializer.save(author=self.request.user)
 
     def list(self, request, *args, **kwargs):
-        qs = self.get_queryset().annotate(
-            like_count=models.Count('likes', distinct=True)
-        ).order_by('-created_at')
+        # read-only feed: plain rows + dict building, skipping PostSerializer on the hot path
+        qs = self.get_queryset().values(
+            'id', 'author_id', 'author__username', 'content', 'created_at'
+        ).annotate(
+            # correlated subqueries: no likes x comments join, and no GROUP BY over the whole table,
+            # so the (-created_at, -id) index can stop after one page
+            like_count=Coalesce(Subquery(
+                PostLike.objects.filter(post=OuterRef('pk')).values('post').annotate(c=Count('*')).values('c')
+            ), 0),
+            comment_count=Coalesce(Subquery(
+                Comment.objects.filter(post=OuterRef('pk')).values('post').annotate(c=Count('*')).values('c')
+            ), 0),
+        )
         page = self.paginate_queryset(qs)
+        rows = page if page is not None else qs
+        data = [
+            {
+                'id': r['id'],
+                'author': {'id': r['author_id'], 'username': r['author__username']},
+                'content': r['content'],
+                'created_at': r['created_at'],
+                'like_count': r['like_count'],
+                'comment_count': r['comment_count'],
+            }
+            for r in rows
+        ]
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response(data)
+        return Response(data)
 
 
 class PostDetailAPIView(APIView):
     permission_classes = (AllowAny,)
 
     def get(self, request, pk):
-        post = generics.get_object_or_404(Post.objects.select_related('author'), pk=pk)
-        # Fetch all comments for the post in one query and build tree in memory
-        comments_qs = Comment.objects.filter(post=post).select_related('author').prefetch_related('likes').order_by('created_at')
-        # build id -> node mapping
+        post = generics.get_object_or_404(
+            Post.objects.select_related('author')
+            .only('id', 'content', 'created_at', 'author__id', 'author__username')
+            .annotate(like_count=Count('likes')),
+            pk=pk,
+        )
+        # Walk the comment tree in SQL; rows come back parents-first (by depth), siblings by created_at
+        comments_qs = Comment.objects.raw(
+            """
+            WITH RECURSIVE tree (id, depth) AS (
+              SELECT c.id, 0
+              FROM core_comment c
+              WHERE c.post_id = %s AND c.parent_id IS NULL
+              UNION ALL
+              SELECT c.id, tree.depth + 1
+              FROM core_comment c JOIN tree ON c.parent_id = tree.id
+              WHERE c.post_id = %s
+            )
+            SELECT c.id, c.author_id, c.parent_id, c.content, c.created_at,
+                   u.username AS author_username, COALESCE(l.cnt, 0) AS like_count
+            FROM tree t
+            JOIN core_comment c ON c.id = t.id
+            JOIN auth_user u ON u.id = c.author_id
+            LEFT JOIN (
+              SELECT cl.comment_id, COUNT(*) AS cnt
+              FROM core_commentlike cl JOIN core_comment lc ON lc.id = cl.comment_id
+              WHERE lc.post_id = %s
+              GROUP BY cl.comment_id
+            ) l ON l.comment_id = t.id
+            ORDER BY t.depth, c.created_at, c.id
+            """,
+            [post.id, post.id, post.id]
+        )
+        # single linear pass: a parent node always exists before its children arrive.
+        # iterator() streams rows without caching model instances, so only the node dicts stay alive
         nodes = {}
-        for c in comments_qs:
-            nodes[c.id] = {
+        root = []
+        for c in comments_qs.iterator():
+            node = {
                 'id': c.id,
-                'author': {'id': c.author.id, 'username': c.author.username},
+                'author': {'id': c.author_id, 'username': c.author_username},
                 'content': c.content,
-                'created_at': c.created_at.isoformat(),
+                'created_at': c.created_at,
                 'parent': c.parent_id,
-                'like_count': c.likes.count(),
+                'like_count': c.like_count,
                 'children': []
             }
-        root = []
-        for nid, node in nodes.items():
-            pid = node['parent']
-            if pid:
-                parent_node = nodes.get(pid)
-                if parent_node is not None:
-                    parent_node['children'].append(node)
+            nodes[c.id] = node
+            if c.parent_id:
+                nodes[c.parent_id]['children'].append(node)
             else:
                 root.append(node)
 
@@ -126,23 +187,45 @@ class PostDetailAPIView(APIView):
             'id': post.id,
             'author': {'id': post.author.id, 'username': post.author.username},
             'content': post.content,
-            'created_at': post.created_at.isoformat(),
-            'like_count': post.likes.count(),
+            'created_at': post.created_at,
+            'like_count': post.like_count,
             'comments': root,
         }
         return Response(post_data)
 
 
+def insert_like(model, user_id, **target):
+    """Insert a like row for the single target FK given as a keyword (e.g. post_id=pk).
+
+    Uses INSERT ... SELECT ... WHERE EXISTS ... ON CONFLICT DO NOTHING, so neither an unknown
+    target nor a duplicate like raises; both just insert nothing and return False. Checking
+    existence in the statement instead of relying on the (deferred) FK keeps this correct inside
+    transaction.atomic() / ATOMIC_REQUESTS as well as in autocommit.
+    """
+    (target_column, target_id), = target.items()
+    target_table = model._meta.get_field(target_column).related_model._meta.db_table
+    created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {model._meta.db_table} (user_id, {target_column}, created_at)
+            SELECT %s, %s, %s
+            WHERE EXISTS (SELECT 1 FROM {target_table} WHERE id = %s)
+            ON CONFLICT DO NOTHING
+            """,
+            [user_id, target_id, created_at, target_id]
+        )
+        return cursor.rowcount > 0
+
+
 class PostLikeAPIView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def post(self, request, pk):
-        post = generics.get_object_or_404(Post, pk=pk)
-
-        try:
-            with transaction.atomic():
-                PostLike.objects.create(user=request.user, post=post)
-        except IntegrityError:
+        if not insert_like(PostLike, request.user.id, post_id=pk):
+            # nothing inserted: tell an unknown post apart from a repeat like (off the happy path)
+            if not Post.objects.filter(pk=pk).exists():
+                return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
             return Response({'detail': 'Already liked'}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({'status': 'liked'})
@@ -161,12 +244,10 @@ class CommentLikeAPIView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def post(self, request, pk):
-        comment = generics.get_object_or_404(Comment, pk=pk)
-
-        try:
-            with transaction.atomic():
-                CommentLike.objects.create(user=request.user, comment=comment)
-        except IntegrityError:
+        if not insert_like(CommentLike, request.user.id, comment_id=pk):
+            # nothing inserted: tell an unknown comment apart from a repeat like (off the happy path)
+            if not Comment.objects.filter(pk=pk).exists():
+                return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
             return Response({'detail': 'Already liked'}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({'status': 'liked'})
@@ -177,30 +258,39 @@ class LeaderboardAPIView(APIView):
     permission_classes = (AllowAny,)
     
     def get(self, request):
-        cutoff = timezone.now() - timedelta(days=1)
+        # bucket the cutoff to the minute so every request in that minute shares one cached result
+        cutoff = timezone.now().replace(second=0, microsecond=0) - timedelta(days=1)
+        result = cache.get_or_set(
+            f'leaderboard:top5:{cutoff:%Y%m%d%H%M}',
+            lambda: self.top_users(cutoff),
+            60
+        )
+        return Response(result)
+
+    def top_users(self, cutoff):
         with connection.cursor() as cursor:
             # union likes with weights, then aggregate per user
             cursor.execute(
                 """
                 SELECT u.id, u.username, COALESCE(SUM(t.weight),0) as karma
                 FROM (
-                  SELECT p.author_id as user_id, 5 as weight, pl.created_at as created_at
-                  FROM core_post p JOIN core_postlike pl ON pl.post_id = p.id
+                  SELECT p.author_id as user_id, 5 as weight
+                  FROM core_postlike pl JOIN core_post p ON p.id = pl.post_id
+                  WHERE pl.created_at >= %s
                   UNION ALL
-                  SELECT c.author_id as user_id, 1 as weight, cl.created_at as created_at
-                  FROM core_comment c JOIN core_commentlike cl ON cl.comment_id = c.id
+                  SELECT c.author_id as user_id, 1 as weight
+                  FROM core_commentlike cl JOIN core_comment c ON c.id = cl.comment_id
+                  WHERE cl.created_at >= %s
                 ) t
                 JOIN auth_user u ON u.id = t.user_id
-                WHERE t.created_at >= %s
                 GROUP BY u.id, u.username
                 ORDER BY karma DESC
                 LIMIT 5
                 """,
-                [cutoff]
+                [cutoff, cutoff]
             )
             rows = cursor.fetchall()
-        result = [{'user_id': r[0], 'username': r[1], 'karma': int(r[2])} for r in rows]
-        return Response(result)
+        return [{'user_id': r[0], 'username': r[1], 'karma': int(r[2])} for r in rows]
 
 
 def index(request, path=''):
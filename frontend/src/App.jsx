@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import "./App.css";
 
@@ -471,6 +471,8 @@ function CreatePostModal({ onClose, onSubmit }) {
 // Main App Component
 function App() {
   const [posts, setPosts] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const loadingMore = useRef(false);
   const [selected, setSelected] = useState(null);
   const [leaderboard, setLeaderboard] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -512,6 +514,7 @@ function App() {
     ])
       .then(([postsData, leaderboardData]) => {
         setPosts(postsData.results || postsData);
+        setNextPage(postsData.next || null);
         setLeaderboard(leaderboardData);
         setLoading(false);
       })
@@ -521,6 +524,42 @@ function App() {
       });
   };
 
+  const loadLeaderboard = () => {
+    fetch(`${API_BASE}/leaderboard/`)
+      .then((r) => r.json())
+      .then(setLeaderboard)
+      .catch((err) => console.error("Error fetching leaderboard:", err));
+  };
+
+  // Feed is cursor-paginated; follow the `next` link to append older posts.
+  // The ref guards against a double click fetching (and appending) the same page twice.
+  const loadMore = () => {
+    if (!nextPage || loadingMore.current) return;
+    loadingMore.current = true;
+    fetch(nextPage)
+      .then((r) => r.json())
+      .then((data) => {
+        setPosts((prev) => [...prev, ...data.results]);
+        setNextPage(data.next || null);
+      })
+      .catch((err) => console.error("Error fetching more posts:", err))
+      .finally(() => {
+        loadingMore.current = false;
+      });
+  };
+
+  // Patch a single feed entry in place so pages appended via "Load more" survive
+  const bumpPostCount = (id, field) => {
+    setPosts((prev) =>
+      prev.map((p) => (p.id === id ? { ...p, [field]: (p[field] || 0) + 1 } : p))
+    );
+  };
+
+  const handlePostLiked = (id) => {
+    bumpPostCount(id, "like_count");
+    loadLeaderboard();
+  };
+
   const viewPost = (id) => {
     fetch(`${API_BASE}/posts/${id}/`)
       .then((r) => r.json())
@@ -579,7 +618,7 @@ function App() {
 
       if (response.ok) {
         viewPost(selected.id);
-        loadData();
+        bumpPostCount(selected.id, "comment_count");
       } else if (response.status === 401) {
         handleLogout();
         setShowAuthModal(true);
@@ -665,7 +704,7 @@ function App() {
                   key={p.id}
                   post={p}
                   onView={viewPost}
-                  onLike={loadData}
+                  onLike={() => handlePostLiked(p.id)}
                   index={idx}
                   currentUser={currentUser}
                 />
@@ -673,6 +712,11 @@ function App() {
             ) : (
               <div className="empty-state">No posts yet</div>
             )}
+            {!loading && nextPage && (
+              <button className="load-more-btn" onClick={loadMore}>
+                Load more
+              </button>
+            )}
           </div>
         </aside>
 
@@ -726,7 +770,7 @@ function App() {
                         <Comment
                           key={c.id}
                           c={c}
-                          onLike={loadData}
+                          onLike={loadLeaderboard}
                           currentUser={currentUser}
                           postId={selected.id}
                           onReplySubmit={() => viewPost(selected.id)}
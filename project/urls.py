@@ -5,5 +5,6 @@ from core import views as core_views
 urlpatterns = [
     path('api/', include('core.urls')),
     path('', core_views.index, name='index'),
-    re_path(r'^.*$', core_views.index),
+    # SPA fallback; the lookahead keeps unknown api/ urls as 404s instead of serving index.html
+    re_path(r'^(?!api/).*$', core_views.index),
 ]
\ No newline at end of file